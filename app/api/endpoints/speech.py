@@ -22,7 +22,7 @@ from app.core import (
     split_text_into_chunks, concatenate_audio_chunks, add_route_aliases,
     TTSStatus, start_tts_request, update_tts_status, get_voice_library
 )
-from app.core.tts_model import get_model, is_multilingual
+from app.core.tts_model import get_inference_pool, get_model, is_multilingual
 from app.core.text_processing import split_text_for_streaming, get_streaming_settings
 
 # Create router with aliasing support
@@ -255,7 +255,7 @@ async def generate_speech_internal(
                     generate_kwargs["language_id"] = language_id
                 
                 audio_tensor = await loop.run_in_executor(
-                    None,
+                    get_inference_pool(),
                     lambda: model.generate(**generate_kwargs)
                 )
                 
@@ -485,7 +485,7 @@ async def generate_speech_streaming(
             with torch.no_grad():
                 # Run TTS generation in executor to avoid blocking
                 audio_tensor = await loop.run_in_executor(
-                    None,
+                    get_inference_pool(),
                     lambda: model.generate(
                         text=chunk,
                         audio_prompt_path=voice_sample_path,
@@ -688,7 +688,7 @@ async def generate_speech_sse(
             with torch.no_grad():
                 # Run TTS generation in executor to avoid blocking
                 audio_tensor = await loop.run_in_executor(
-                    None,
+                    get_inference_pool(),
                     lambda: model.generate(
                         text=chunk,
                         audio_prompt_path=voice_sample_path,
@@ -6,16 +6,16 @@ bidirectional communication for TTS generation with true model-level streaming.
 """
 
 import uuid
-import json
 import traceback
 from typing import Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
-from app.models import TrueStreamingRequest, WebSocketStreamingMessage
-from app.core.websocket_manager import get_connection_manager
-from app.core.true_streaming import generate_true_streaming_audio, create_wav_header
-from app.core.tts_model import is_streaming_ready, get_streaming_model, get_streaming_initialization_error
+from app.models import WS_MESSAGE_ADAPTER
+from app.core.websocket_manager import get_connection_manager, pack_audio_frame, MSGPACK_AVAILABLE
+from app.core.true_streaming import generate_true_streaming_audio
+from app.core.tts_model import is_streaming_ready, get_streaming_model, get_streaming_initialization_error, get_wav_header
 from app.api.endpoints.speech import resolve_voice_path_and_language
 
 router = APIRouter()
@@ -50,7 +50,8 @@ async def get_streaming_status():
         "available": True,
         "ready": True,
         "sample_rate": model.sr if hasattr(model, 'sr') else 24000,
-        "supported_formats": ["wav", "base64"],
+        "supported_formats": ["wav"],
+        "supported_metrics_formats": ["json", "msgpack"] if MSGPACK_AVAILABLE else ["json"],
         "description": "TRUE model-level streaming with KV-cache",
         "features": {
             "incremental_generation": True,
@@ -99,12 +100,19 @@ async def websocket_stream_audio(websocket: WebSocket):
     }
 
     Message Format (Server -> Client):
-    - Binary: WAV header followed by audio chunks
+    - Binary: WAV header followed by raw PCM audio chunks (output_format="base64" is
+      deprecated over WebSocket and is sent as raw PCM without the WAV header)
     - JSON (info): {"type": "info", "message": "..."}
     - JSON (error): {"type": "error", "error": "..."}
     - JSON (metrics): {"type": "metrics", "data": {...}}
     - JSON (done): {"type": "done", "total_chunks": N}
     - JSON (pong): {"type": "pong"}
+
+    When the request sets "metrics_format": "msgpack", each audio chunk and its metrics
+    are sent together as ONE binary frame instead of a binary frame plus a JSON message:
+    [u32 little-endian metrics length][MessagePack metrics dict][audio bytes]
+    The metrics length is 0 for the WAV header frame and when metrics are disabled.
+    Other messages (info, done, error) remain JSON text.
     """
 
     # Generate unique connection ID
@@ -133,20 +141,17 @@ async def websocket_stream_audio(websocket: WebSocket):
                 print(f"[{connection_id}] Client disconnected")
                 break
 
-            # Parse message
+            # Parse and validate in one pass (pydantic-core parses the JSON directly into the model)
             try:
-                message_data = json.loads(raw_message)
-                message = WebSocketStreamingMessage(**message_data)
-            except json.JSONDecodeError:
+                message = WS_MESSAGE_ADAPTER.validate_json(raw_message)
+            except ValidationError as e:
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    error_message = "Invalid JSON format"
+                else:
+                    error_message = f"Invalid message format: {str(e)}"
                 await manager.send_json(connection_id, {
                     "type": "error",
-                    "error": "Invalid JSON format"
-                })
-                continue
-            except Exception as e:
-                await manager.send_json(connection_id, {
-                    "type": "error",
-                    "error": f"Invalid message format: {str(e)}"
+                    "error": error_message
                 })
                 continue
 
@@ -208,6 +213,24 @@ async def websocket_stream_audio(websocket: WebSocket):
                     }
                 })
 
+                # Negotiate metrics encoding (falls back to JSON if msgpack is not installed)
+                use_msgpack = request.metrics_format == "msgpack"
+                if use_msgpack and not MSGPACK_AVAILABLE:
+                    use_msgpack = False
+                    await manager.send_json(connection_id, {
+                        "type": "info",
+                        "message": "msgpack is not available on the server, sending metrics as JSON",
+                        "metrics_format": "json"
+                    })
+
+                # WebSocket frames are binary-safe, so audio is always sent as raw PCM
+                if request.output_format == "base64":
+                    print(f"[{connection_id}] output_format='base64' is deprecated over WebSocket, sending raw PCM")
+                    await manager.send_json(connection_id, {
+                        "type": "info",
+                        "message": "output_format 'base64' is deprecated for WebSocket streaming; audio is sent as raw PCM binary frames"
+                    })
+
                 # Update connection state
                 manager.update_connection_state(connection_id, "streaming")
 
@@ -215,12 +238,9 @@ async def websocket_stream_audio(websocket: WebSocket):
                 try:
                     # Send WAV header if output format is WAV
                     if request.output_format == "wav":
-                        model = get_streaming_model()
-                        wav_header = create_wav_header(
-                            sample_rate=model.sr,
-                            channels=1,
-                            bits_per_sample=16
-                        )
+                        wav_header = get_wav_header()
+                        if use_msgpack:
+                            wav_header = pack_audio_frame(wav_header)
                         await manager.send_bytes(connection_id, wav_header)
 
                     chunk_count = 0
@@ -229,12 +249,23 @@ async def websocket_stream_audio(websocket: WebSocket):
                     async for audio_chunk, metrics in generate_true_streaming_audio(
                         request=request,
                         voice_sample_path=voice_path,
-                        connection_id=connection_id
+                        connection_id=connection_id,
+                        force_binary=True
                     ):
+                        # Stop generating for a client that was dropped for falling behind
+                        if not manager.is_connected(connection_id):
+                            break
+
                         chunk_count += 1
 
-                        # Send audio chunk
-                        await manager.send_bytes(connection_id, audio_chunk)
+                        if use_msgpack:
+                            # Send audio chunk and its metrics as a single framed message
+                            frame = pack_audio_frame(audio_chunk, metrics if request.include_metrics else None)
+                            await manager.send_bytes(connection_id, frame)
+                            continue
+
+                        # Send audio chunk (raw PCM, may be merged with other queued chunks)
+                        await manager.send_audio(connection_id, audio_chunk)
 
                         # Send metrics if requested
                         if request.include_metrics and metrics:
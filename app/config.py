@@ -49,6 +49,13 @@ class Config:
     MEMORY_CLEANUP_INTERVAL = int(os.getenv('MEMORY_CLEANUP_INTERVAL', 5))
     CUDA_CACHE_CLEAR_INTERVAL = int(os.getenv('CUDA_CACHE_CLEAR_INTERVAL', 3))
     ENABLE_MEMORY_MONITORING = os.getenv('ENABLE_MEMORY_MONITORING', 'true').lower() == 'true'
+
+    # Inference performance settings
+    COMPILE_MODEL = os.getenv('COMPILE_MODEL', 'false').lower() == 'true'
+    WARMUP_ON_START = os.getenv('WARMUP_ON_START', 'true').lower() == 'true'
+    CUDNN_BENCHMARK = os.getenv('CUDNN_BENCHMARK', 'false').lower() == 'true'
+    CPU_NUM_THREADS = int(os.getenv('CPU_NUM_THREADS', 1))
+    INFERENCE_DTYPE = os.getenv('INFERENCE_DTYPE', 'float32').lower()
     
     # CORS settings
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*')
@@ -70,6 +77,10 @@ class Config:
             raise ValueError(f"MEMORY_CLEANUP_INTERVAL must be positive, got {cls.MEMORY_CLEANUP_INTERVAL}")
         if cls.CUDA_CACHE_CLEAR_INTERVAL <= 0:
             raise ValueError(f"CUDA_CACHE_CLEAR_INTERVAL must be positive, got {cls.CUDA_CACHE_CLEAR_INTERVAL}")
+        if cls.CPU_NUM_THREADS <= 0:
+            raise ValueError(f"CPU_NUM_THREADS must be positive, got {cls.CPU_NUM_THREADS}")
+        if cls.INFERENCE_DTYPE not in ('float32', 'float16', 'bfloat16', 'auto'):
+            raise ValueError(f"INFERENCE_DTYPE must be one of: float32, float16, bfloat16, auto, got {cls.INFERENCE_DTYPE}")
         if cls.LONG_TEXT_MAX_LENGTH <= cls.MAX_TOTAL_LENGTH:
             raise ValueError(f"LONG_TEXT_MAX_LENGTH ({cls.LONG_TEXT_MAX_LENGTH}) must be greater than MAX_TOTAL_LENGTH ({cls.MAX_TOTAL_LENGTH})")
         if cls.LONG_TEXT_CHUNK_SIZE <= 0:
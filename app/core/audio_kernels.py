@@ -0,0 +1,61 @@
+"""
+Compiled audio kernels for the CPU streaming path
+
+Converts float audio to int16 PCM (clamp, scale, cast and optional fade-in) in a single pass.
+Uses Numba when installed and falls back to NumPy otherwise.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# Empty fade curve used when no fade-in should be applied
+_NO_FADE = np.zeros(0, dtype=np.int32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _f32_to_pcm16(x, out, fade_q15):
+        n_fade = fade_q15.size
+        for i in range(x.size):
+            v = x[i]
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            s = np.int32(v * 32767.0)
+            if i < n_fade:
+                s = (s * fade_q15[i]) >> 15
+            out[i] = np.int16(s)
+
+    # Compile at import so the first streamed chunk does not pay the JIT cost
+    _f32_to_pcm16(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int16), _NO_FADE)
+else:
+    def _f32_to_pcm16(x, out, fade_q15):
+        scaled = (np.clip(x, -1.0, 1.0) * 32767.0).astype(np.int32)
+        n = min(x.size, fade_q15.size)
+        scaled[:n] = (scaled[:n] * fade_q15[:n]) >> 15
+        out[:] = scaled
+
+
+def float_to_pcm16(samples: np.ndarray, fade_q15: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert float samples in [-1, 1] to int16 PCM.
+
+    Args:
+        samples: 1-D float32 array
+        fade_q15: Optional Q15 fixed-point fade-in gains applied to the first samples
+
+    Returns:
+        1-D int16 array
+    """
+    out = np.empty(samples.size, dtype=np.int16)
+    _f32_to_pcm16(samples, out, _NO_FADE if fade_q15 is None else fade_q15)
+    return out
@@ -12,6 +12,9 @@ Key differences from fake streaming:
 """
 
 import asyncio
+import functools
+import os
+import threading
 import time
 import base64
 import struct
@@ -21,7 +24,8 @@ import torch
 import torchaudio as ta
 import numpy as np
 
-from app.core.tts_model import get_streaming_model, is_streaming_ready
+from app.core.audio_kernels import float_to_pcm16
+from app.core.tts_model import get_streaming_model, get_inference_pool, get_wav_header, inference_autocast, is_streaming_ready
 from app.models import TrueStreamingRequest
 
 
@@ -47,10 +51,35 @@ def create_wav_header(sample_rate: int, channels: int, bits_per_sample: int, dat
     return header.getvalue()
 
 
+# Serializes conditionals cache misses (prepare_conditionals() writes model.conds) with the
+# model.conds assignment. It does not cover the generation that follows, which reads and may
+# replace model.conds; that relies on the single-worker inference pool.
+_conds_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_conditionals(voice_sample_path: str, mtime: float):
+    """
+    Compute the reference-voice conditionals for a voice sample once.
+
+    Keyed by (path, mtime) so a voice file replaced on disk is re-encoded.
+    """
+    model = get_streaming_model()
+    model.prepare_conditionals(voice_sample_path)
+    return model.conds
+
+
+def apply_cached_conditionals(model, voice_sample_path: str):
+    """Set model.conds from the cache, encoding the voice sample only on first use"""
+    with _conds_lock:
+        model.conds = _load_conditionals(voice_sample_path, os.path.getmtime(voice_sample_path))
+
+
 async def generate_true_streaming_audio(
     request: TrueStreamingRequest,
     voice_sample_path: str,
-    connection_id: Optional[str] = None
+    connection_id: Optional[str] = None,
+    force_binary: bool = False
 ) -> AsyncGenerator[Tuple[bytes, Optional[Dict[str, Any]]], None]:
     """
     Generate audio using TRUE model-level streaming.
@@ -62,6 +91,7 @@ async def generate_true_streaming_audio(
         request: TrueStreamingRequest with all streaming parameters
         voice_sample_path: Path to the voice sample audio file
         connection_id: Optional connection ID for logging
+        force_binary: Always yield raw PCM, ignoring output_format="base64" (binary transports)
 
     Yields:
         Tuple of (audio_bytes, metrics_dict)
@@ -90,21 +120,74 @@ async def generate_true_streaming_audio(
         print(f"[{connection_id or 'stream'}] Text: {request.input[:100]}...")
         print(f"[{connection_id or 'stream'}] Parameters: chunk_size={request.chunk_size}, context_window={request.context_window}, temperature={request.temperature}")
 
-        # Run the synchronous generator in a thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Bridge the synchronous generator to this coroutine through a bounded queue.
+        # A worker thread drives model.generate_stream() and hands each chunk over
+        # as soon as it is produced, so the first chunk is yielded without waiting
+        # for the whole utterance to be generated.
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+        stop_event = threading.Event()
+
+        sample_rate = model.sr
+
+        # Fade-in curve as Q15 fixed-point gains, computed once per request
+        fade_q15 = None
+        if request.enable_fade_in:
+            fade_samples = int(request.fade_in_duration_ms * sample_rate / 1000)
+            if fade_samples > 0:
+                fade_q15 = (np.linspace(0.0, 1.0, fade_samples, dtype=np.float32) * (1 << 15)).astype(np.int32)
+
+        # Field names of the model's StreamingMetrics objects, resolved on the first chunk
+        metrics_fields = None
+
+        # Pinned host staging buffer for device-to-host PCM copies (CUDA only), grown on demand
+        pinned = None
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def chunk_to_pcm(audio_chunk: torch.Tensor, chunk_fade: Optional[np.ndarray]) -> bytes:
+            """Convert a generated chunk to 16-bit PCM bytes (runs on the inference thread)"""
+            nonlocal pinned
+
+            if audio_chunk.device.type == 'cpu':
+                # Clamp, scale, cast and fade in one compiled pass
+                return float_to_pcm16(audio_chunk.reshape(-1).float().numpy(), chunk_fade).tobytes()
+
+            # Convert tensor to int16 PCM in a single pass on the chunk's device
+            audio_int = audio_chunk.clamp(-1.0, 1.0).mul(32767).to(torch.int16).reshape(-1)
+            if audio_int.is_cuda:
+                # Copy into a reusable pinned host buffer instead of allocating per chunk.
+                # Waiting on the stream here blocks this thread only, never the event loop.
+                num_samples = audio_int.numel()
+                if pinned is None or pinned.numel() < num_samples:
+                    pinned = torch.empty(num_samples, dtype=torch.int16, pin_memory=True)
+                pinned[:num_samples].copy_(audio_int, non_blocking=True)
+                torch.cuda.current_stream(audio_int.device).synchronize()
+                audio_array = pinned[:num_samples].numpy()
+            else:
+                audio_array = audio_int.cpu().numpy()
+
+            if chunk_fade is not None:
+                n = min(audio_array.size, chunk_fade.size)
+                audio_array[:n] = (audio_array[:n].astype(np.int32) * chunk_fade[:n]) >> 15
+            return audio_array.tobytes()
 
-        # Create the generator function to run in executor
+        # Create the producer function to run in executor
         def run_streaming_generator():
-            """Run the synchronous streaming generator"""
+            """Run the synchronous streaming generator, forwarding chunks to the queue"""
             try:
                 # Call the streaming model's generate_stream method
                 # Note: generate_stream has a simpler signature than generate()
                 # Only these parameters are supported:
                 #   text, audio_prompt_path, exaggeration, cfg_weight, temperature,
                 #   chunk_size, context_window, fade_duration, print_metrics
+                # The reference voice is applied from the conditionals cache, so no
+                # audio_prompt_path is passed and generate_stream() reuses model.conds.
+                apply_cached_conditionals(model, voice_sample_path)
                 generator = model.generate_stream(
                     text=request.input,
-                    audio_prompt_path=voice_sample_path,
+                    audio_prompt_path=None,
                     exaggeration=request.exaggeration,
                     cfg_weight=request.cfg_weight,
                     temperature=request.temperature,
@@ -114,89 +197,94 @@ async def generate_true_streaming_audio(
                     print_metrics=request.print_metrics,
                 )
 
-                # Collect all chunks from the generator
-                chunks = []
-                for audio_chunk, metrics in generator:
-                    chunks.append((audio_chunk, metrics))
-
-                return chunks
+                with inference_autocast():
+                    # Fade-in applies to the start of the stream only
+                    chunk_fade = fade_q15
+                    for audio_chunk, metrics in generator:
+                        if stop_event.is_set():
+                            break
+                        # Only host bytes cross over to the event loop, which never touches the device
+                        put((chunk_to_pcm(audio_chunk, chunk_fade), audio_chunk.shape[-1], metrics))
+                        chunk_fade = None
 
             except Exception as e:
                 print(f"[{connection_id or 'stream'}] Error in streaming generator: {e}")
-                raise
-
-        # Run the generator in a thread pool
-        chunks = await loop.run_in_executor(None, run_streaming_generator)
-
-        # Process and yield each chunk
-        for audio_chunk, metrics in chunks:
-            chunk_count += 1
-
-            if first_chunk_time is None:
-                first_chunk_time = time.time()
-                latency_to_first = first_chunk_time - start_time
-                print(f"[{connection_id or 'stream'}] ⚡ First chunk latency: {latency_to_first:.3f}s")
-
-            # Convert tensor to PCM bytes
-            audio_tensor = torch.clamp(audio_chunk, -1.0, 1.0)
-            audio_int = (audio_tensor * 32767).to(torch.int16)
-            pcm_data = audio_int.cpu().numpy().tobytes()
-
-            # Apply fade-in if enabled
-            if request.enable_fade_in and chunk_count > 1:
-                # Calculate fade-in samples
-                sample_rate = model.sr
-                fade_samples = int(request.fade_in_duration_ms * sample_rate / 1000)
-
-                if len(pcm_data) >= fade_samples * 2:  # 2 bytes per sample
-                    # Convert to numpy array for fade processing
-                    audio_array = np.frombuffer(pcm_data, dtype=np.int16).copy()
-                    fade_curve = np.linspace(0.0, 1.0, fade_samples)
-                    audio_array[:fade_samples] = (audio_array[:fade_samples] * fade_curve).astype(np.int16)
-                    pcm_data = audio_array.tobytes()
-
-            # Encode based on output format
-            if request.output_format == "base64":
-                output_data = base64.b64encode(pcm_data)
-            else:
-                output_data = pcm_data
-
-            # Build metrics if requested
-            metrics_dict = None
-            if request.include_metrics:
-                current_time = time.time()
-                elapsed_time = current_time - start_time
-
-                # Calculate audio duration
-                sample_rate = model.sr
-                audio_duration = len(audio_chunk[0]) / sample_rate
-
-                # Calculate RTF (Real-Time Factor)
-                rtf = elapsed_time / audio_duration if audio_duration > 0 else 0
-
-                metrics_dict = {
-                    "chunk": chunk_count,
-                    "latency_to_first_chunk": latency_to_first - start_time if first_chunk_time else None,
-                    "elapsed_time": elapsed_time,
-                    "audio_duration": audio_duration,
-                    "rtf": rtf,
-                    "chunk_size_bytes": len(output_data),
-                    "sample_rate": sample_rate,
-                }
-
-                # Add model metrics if available
-                if metrics:
-                    # Convert StreamingMetrics object to dict
-                    if hasattr(metrics, '__dict__'):
-                        metrics_dict.update(vars(metrics))
-                    elif isinstance(metrics, dict):
-                        metrics_dict.update(metrics)
-
-            # Yield the chunk
-            yield output_data, metrics_dict
-
-            # Cleanup tensors
-            del audio_chunk, audio_tensor, audio_int
+                put(e)
+            finally:
+                # Sentinel: no more chunks
+                put(None)
+
+        # Run the producer on the dedicated inference pool
+        producer = loop.run_in_executor(get_inference_pool(), run_streaming_generator)
+
+        # Process and yield each chunk as it arrives
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                pcm_data, num_samples, metrics = item
+                chunk_count += 1
+
+                if first_chunk_time is None:
+                    first_chunk_time = time.time()
+                    latency_to_first = first_chunk_time - start_time
+                    print(f"[{connection_id or 'stream'}] ⚡ First chunk latency: {latency_to_first:.3f}s")
+
+                # Encode based on output format
+                if request.output_format == "base64" and not force_binary:
+                    output_data = base64.b64encode(pcm_data)
+                else:
+                    output_data = pcm_data
+
+                # Build metrics if requested
+                metrics_dict = None
+                if request.include_metrics:
+                    current_time = time.time()
+                    elapsed_time = current_time - start_time
+
+                    # Calculate audio duration
+                    audio_duration = num_samples / sample_rate
+
+                    # Calculate RTF (Real-Time Factor)
+                    rtf = elapsed_time / audio_duration if audio_duration > 0 else 0
+
+                    metrics_dict = {
+                        "chunk": chunk_count,
+                        "latency_to_first_chunk": latency_to_first,
+                        "elapsed_time": elapsed_time,
+                        "audio_duration": audio_duration,
+                        "rtf": rtf,
+                        "chunk_size_bytes": len(output_data),
+                        "sample_rate": sample_rate,
+                    }
+
+                    # Add model metrics if available
+                    if metrics:
+                        if isinstance(metrics, dict):
+                            metrics_dict.update(metrics)
+                        elif hasattr(metrics, '__dict__'):
+                            # StreamingMetrics has a fixed field set: read it once, then copy by attribute
+                            if metrics_fields is None:
+                                metrics_fields = tuple(vars(metrics))
+                            for field in metrics_fields:
+                                metrics_dict[field] = getattr(metrics, field)
+
+                # Yield the chunk
+                yield output_data, metrics_dict
+
+            await producer
+        finally:
+            # Stop the producer if the consumer bailed out early (e.g. client disconnect)
+            # and drain the queue so a blocked put() can complete.
+            stop_event.set()
+            while not queue.empty():
+                queue.get_nowait()
+
+            # Release cached allocator blocks once per stream, not per chunk
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
 
@@ -235,16 +323,8 @@ async def generate_true_streaming_wav(
         bytes: WAV header first, then PCM audio chunks
     """
 
-    # Get the streaming model to determine sample rate
-    model = get_streaming_model()
-
     # Yield WAV header first
-    wav_header = create_wav_header(
-        sample_rate=model.sr,
-        channels=1,
-        bits_per_sample=16
-    )
-    yield wav_header
+    yield get_wav_header()
 
     # Yield audio chunks
     async for audio_chunk, metrics in generate_true_streaming_audio(
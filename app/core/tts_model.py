@@ -9,10 +9,15 @@ Multilingual support is NOT available (English only).
 """
 
 import os
+import time
 import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Optional, Dict, Any
 
+import torch
+
 # Chatterbox Streaming TTS (includes both generate() and generate_stream())
 try:
     from chatterbox.tts import ChatterboxTTS
@@ -32,6 +37,69 @@ _initialization_error = None
 _initialization_progress = ""
 _is_multilingual = False  # Streaming package is English only
 _supported_languages = {"en": "English"}  # English only
+_wav_header = None  # Streaming WAV header for the loaded model's sample rate (mono, 16-bit)
+_inference_dtype = None  # Autocast dtype for CUDA streaming inference, None for float32
+
+# Dedicated executor for ALL model inference (generate() and generate_stream()). Keeps TTS work
+# off asyncio's default executor and serializes it: both read and update the shared model.conds
+# while they run, so only one generation may use the model at a time.
+_inference_pool = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="tts-infer"
+)
+
+
+def _configure_cpu_threads():
+    """
+    Limit OpenMP/MKL/PyTorch threading for CPU inference.
+
+    Explicit OMP_NUM_THREADS / MKL_NUM_THREADS environment variables take precedence.
+    """
+    num_threads = str(Config.CPU_NUM_THREADS)
+    os.environ.setdefault("OMP_NUM_THREADS", num_threads)
+    os.environ.setdefault("MKL_NUM_THREADS", num_threads)
+    torch.set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+    try:
+        torch.set_num_interop_threads(int(os.environ["OMP_NUM_THREADS"]))
+    except RuntimeError:
+        # Inter-op threads can only be set before any parallel work has started
+        pass
+
+
+# Apply thread limits before any torch op runs
+if detect_device() == 'cpu':
+    _configure_cpu_threads()
+
+
+# Submodules compiled with torch.compile: the ones generate() / generate_stream() invoke
+# through nn.Module.__call__ on every step. T3 decodes via t3.inference() -> the HF backend
+# -> t3.tfmr, and S3Gen via flow.inference() -> flow.encoder / flow.decoder -> estimator (once
+# per ODE step), so compiling t3.forward / s3gen.forward would never be hit. The HiFT
+# vocoder (s3gen.mel2wav) is left eager: it is entered through .inference() and its
+# STFT/iSTFT ops do not compile well.
+_COMPILE_TARGETS = ("t3.tfmr", "s3gen.flow.encoder", "s3gen.flow.decoder.estimator")
+
+_INFERENCE_DTYPES = {"float16": torch.float16, "bfloat16": torch.bfloat16}
+
+
+def _resolve_inference_dtype(device: str):
+    """Map Config.INFERENCE_DTYPE to a torch dtype (reduced precision is CUDA only)"""
+    if Config.INFERENCE_DTYPE == 'float32' or not device.startswith('cuda'):
+        return None
+    if Config.INFERENCE_DTYPE == 'auto':
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return _INFERENCE_DTYPES[Config.INFERENCE_DTYPE]
+
+
+def inference_autocast():
+    """
+    Autocast context for model inference.
+
+    Autocast state is thread-local, so enter this in the thread that iterates the generator.
+    """
+    if _inference_dtype is None:
+        return contextlib.nullcontext()
+    return torch.autocast(device_type='cuda', dtype=_inference_dtype)
 
 
 class InitializationState(Enum):
@@ -41,6 +109,62 @@ class InitializationState(Enum):
     ERROR = "error"
 
 
+def _compile_model(model):
+    """
+    Compile the model's hot-path submodules with torch.compile.
+
+    nn.Module.compile() swaps the module's __call__, so every caller that invokes the
+    submodule picks up the compiled version; on torch < 2.2, which lacks it, the module's
+    forward is wrapped instead. Shapes change per decode step (growing KV cache) and per
+    chunk, so dynamic shapes are left to torch.compile's automatic detection instead of
+    recompiling (or capturing a CUDA graph) for every length.
+    Compilation happens lazily on the first call, which _warmup_model() triggers at startup.
+    A submodule that cannot be compiled is skipped and keeps running eagerly.
+
+    Returns:
+        True if at least one submodule was compiled
+    """
+    compiled = False
+    for path in _COMPILE_TARGETS:
+        module = model
+        for name in path.split("."):
+            module = getattr(module, name, None)
+            if module is None:
+                break
+        if not isinstance(module, torch.nn.Module):
+            print(f"⚠ {path} not found on the model, not compiling it")
+            continue
+        try:
+            if hasattr(module, "compile"):
+                module.compile()
+            else:
+                module.forward = torch.compile(module.forward)
+        except Exception as e:
+            print(f"⚠ Compiling {path} failed, running it eagerly: {e}")
+            continue
+        compiled = True
+        print(f"✓ Compiled {path} with torch.compile")
+    return compiled
+
+
+def _warmup_model(model) -> float:
+    """
+    Run one short streaming generation and discard the audio.
+
+    Pays first-call costs (CUDA allocator growth, cuDNN algorithm selection, torch.compile)
+    at startup instead of on the first request, and primes the conditionals cache for the
+    default voice. Returns the warm-up time in seconds.
+    """
+    from app.core.true_streaming import apply_cached_conditionals
+
+    start_time = time.time()
+    apply_cached_conditionals(model, Config.VOICE_SAMPLE_PATH)
+    with inference_autocast():
+        for _ in model.generate_stream(text="Hello.", audio_prompt_path=None, chunk_size=25, print_metrics=False):
+            break
+    return time.time() - start_time
+
+
 async def initialize_model():
     """
     Initialize the Chatterbox TTS model with streaming support.
@@ -49,7 +173,7 @@ async def initialize_model():
     - model.generate() for standard generation
     - model.generate_stream() for TRUE streaming
     """
-    global _model, _device, _initialization_state, _initialization_error, _initialization_progress, _is_multilingual, _supported_languages
+    global _model, _device, _initialization_state, _initialization_error, _initialization_progress, _is_multilingual, _supported_languages, _wav_header, _inference_dtype
 
     if not STREAMING_AVAILABLE:
         _initialization_state = InitializationState.ERROR.value
@@ -79,7 +203,7 @@ async def initialize_model():
 
         _initialization_progress = "Configuring device compatibility..."
         if _device == 'cpu':
-            import torch
+            _configure_cpu_threads()
             original_load = torch.load
             original_load_file = None
 
@@ -108,6 +232,41 @@ async def initialize_model():
             lambda: ChatterboxTTS.from_pretrained(device=_device)
         )
 
+        _inference_dtype = _resolve_inference_dtype(_device)
+        if _inference_dtype is not None:
+            # Weights stay float32 (the model is shared with the non-autocast generate() paths,
+            # and S3Gen's STFT ops need float32); inference_autocast() runs the eligible ops
+            # of streaming generation in reduced precision
+            print(f"Using {_inference_dtype} autocast for streaming inference")
+
+        if Config.CUDNN_BENCHMARK and _device.startswith('cuda'):
+            # cuDNN benchmarks every new input shape once; text and chunk lengths vary per
+            # request, so unseen shapes are still benchmarked during live generation
+            torch.backends.cudnn.benchmark = True
+            print("cuDNN benchmark mode enabled")
+
+        compiled = False
+        if Config.COMPILE_MODEL:
+            if _device.startswith('cuda'):
+                print(f"Compiling model with torch.compile...")
+                compiled = _compile_model(_model)
+            else:
+                print(f"COMPILE_MODEL is only supported on CUDA, skipping compilation on {_device}")
+
+        # A compiled model is always warmed up so compilation never lands on a request
+        if Config.WARMUP_ON_START or compiled:
+            _initialization_progress = "Warming up model (this may take a while)..."
+            print(f"Warming up model...")
+            try:
+                warmup_time = await loop.run_in_executor(_inference_pool, _warmup_model, _model)
+                print(f"✓ Model warm-up completed in {warmup_time:.2f}s")
+            except Exception as e:
+                print(f"⚠ Model warm-up failed, continuing without it: {e}")
+
+        # The streaming WAV header only depends on the model's sample rate, so build it once
+        from app.core.true_streaming import create_wav_header
+        _wav_header = create_wav_header(sample_rate=_model.sr, channels=1, bits_per_sample=16)
+
         _is_multilingual = False
         _supported_languages = {"en": "English"}
 
@@ -146,6 +305,16 @@ def get_model():
     return _model
 
 
+def get_inference_pool() -> ThreadPoolExecutor:
+    """Get the executor that model inference runs on"""
+    return _inference_pool
+
+
+def get_wav_header() -> bytes:
+    """Get the precomputed streaming WAV header for the loaded model"""
+    return _wav_header
+
+
 def get_device():
     """Get the current device"""
     return _device
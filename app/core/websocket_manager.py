@@ -4,115 +4,267 @@ WebSocket connection manager for true model-level streaming
 
 import asyncio
 import json
-from typing import Dict, Set
+import struct
+from typing import Dict, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def json_dumps(data) -> str:
+    """Serialize data to a JSON string (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+# Seconds disconnect() waits for a writer to flush messages that are already queued
+WRITER_FLUSH_TIMEOUT = 5.0
+
+# Maximum messages queued per connection; a client whose queue fills up is disconnected
+OUTBOUND_QUEUE_SIZE = 256
+
+# Upper bound (bytes) on consecutive queued audio chunks merged into one binary frame
+COALESCE_MAX_BYTES = 64 * 1024
+
+# Writer-local marker for "no message held back while coalescing" (None is the shutdown sentinel)
+_NO_PENDING = object()
+
+# Length prefix of framed binary messages: [u32 metadata length][metadata][audio]
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def pack_audio_frame(audio: bytes, metrics: Optional[dict] = None) -> bytes:
+    """Pack audio and its (optional) MessagePack-encoded metrics into a single binary frame"""
+    metadata = msgpack.packb(metrics, use_bin_type=True) if metrics else b""
+    return _FRAME_HEADER.pack(len(metadata)) + metadata + audio
+
+
+class ConnectionRecord:
+    """Per-connection state: socket, its bound send methods, streaming state, outbound queue and its writer task"""
+
+    __slots__ = ("ws", "send_bytes", "send_text", "state", "queue", "writer")
+
+    def __init__(self, ws: WebSocket):
+        self.ws = ws
+        # Bound once per connection instead of resolved on every send
+        self.send_bytes = ws.send_bytes
+        self.send_text = ws.send_text
+        self.state = "connected"
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.writer: Optional[asyncio.Task] = None
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for TTS streaming"""
+    """
+    Manages WebSocket connections for TTS streaming
+
+    Each connection has a bounded outbound queue drained by a single writer task, so
+    send_* calls only enqueue and never wait on the socket. A client that falls so far
+    behind that its queue fills up is disconnected on the spot, so it never stalls the
+    producer (and with it the shared inference worker) for other clients.
+    Broadcasts are queued the same way, so each socket only ever has one writer.
+    """
 
     def __init__(self):
-        # Active connections: {connection_id: WebSocket}
-        self.active_connections: Dict[str, WebSocket] = {}
-        # Connection states: {connection_id: state}
-        self.connection_states: Dict[str, str] = {}
-        # Lock for thread-safe operations
-        self.lock = asyncio.Lock()
+        # Active connections: {connection_id: ConnectionRecord}
+        self.connections: Dict[str, ConnectionRecord] = {}
+        # Background socket closes for dropped clients (strong references until they finish)
+        self._closing: Set[asyncio.Task] = set()
+        # No lock: the manager is only used from the event loop, and every update of the
+        # table runs without an await, so no other coroutine can interleave
 
     async def connect(self, websocket: WebSocket, connection_id: str):
         """Accept and register a new WebSocket connection"""
         await websocket.accept()
-        async with self.lock:
-            self.active_connections[connection_id] = websocket
-            self.connection_states[connection_id] = "connected"
-        logger.info(f"WebSocket connection established: {connection_id}")
-        logger.info(f"Total active connections: {len(self.active_connections)}")
+        rec = ConnectionRecord(websocket)
+        rec.writer = asyncio.create_task(self._writer(connection_id, rec))
+        self.connections[connection_id] = rec
+        logger.info("WebSocket connection established: %s", connection_id)
+        logger.info("Total active connections: %s", len(self.connections))
 
     async def disconnect(self, connection_id: str):
-        """Remove a WebSocket connection"""
-        async with self.lock:
-            if connection_id in self.active_connections:
-                del self.active_connections[connection_id]
-            if connection_id in self.connection_states:
-                del self.connection_states[connection_id]
-        logger.info(f"WebSocket connection closed: {connection_id}")
-        logger.info(f"Total active connections: {len(self.active_connections)}")
+        """Remove a WebSocket connection, flushing any messages still queued for it"""
+        rec = self._unregister(connection_id)
 
-    async def send_text(self, connection_id: str, message: str):
-        """Send a text message to a specific connection"""
-        if connection_id in self.active_connections:
+        if rec is not None:
+            is_writer = rec.writer is asyncio.current_task()
             try:
-                await self.active_connections[connection_id].send_text(message)
+                # Sentinel: the writer stops once everything queued before it has been sent
+                rec.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # Too far behind to flush; drop what is queued
+                logger.warning("Dropping %s queued messages for %s", rec.queue.qsize(), connection_id)
+                if not is_writer:
+                    rec.writer.cancel()
+            else:
+                if not is_writer:
+                    try:
+                        await asyncio.wait_for(rec.writer, timeout=WRITER_FLUSH_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        logger.warning("Timed out flushing queued messages for %s", connection_id)
+
+        logger.info("WebSocket connection closed: %s", connection_id)
+        logger.info("Total active connections: %s", len(self.connections))
+
+    def _unregister(self, connection_id: str) -> Optional[ConnectionRecord]:
+        """Remove a connection from the table; returns its record"""
+        return self.connections.pop(connection_id, None)
+
+    async def _writer(self, connection_id: str, rec: ConnectionRecord):
+        """
+        Send a connection's queued messages in order (bytes as binary frames, str as text frames).
+
+        Raw audio chunks (queued by send_audio as memoryviews) that are already waiting
+        back to back are merged into a single binary frame of up to COALESCE_MAX_BYTES.
+        """
+        # Hoisted out of the per-message loop
+        queue = rec.queue
+        send_bytes = rec.send_bytes
+        send_text = rec.send_text
+
+        # Message taken off the queue while coalescing that still has to be sent
+        pending = _NO_PENDING
+        while True:
+            if pending is not _NO_PENDING:
+                message, pending = pending, _NO_PENDING
+            else:
+                message = await queue.get()
+            if message is None:
+                return
+
+            if isinstance(message, memoryview):
+                parts = [message]
+                size = message.nbytes
+                while not queue.empty():
+                    following = queue.get_nowait()
+                    if not isinstance(following, memoryview) or size + following.nbytes > COALESCE_MAX_BYTES:
+                        pending = following
+                        break
+                    parts.append(following)
+                    size += following.nbytes
+                message = message.obj if len(parts) == 1 else b"".join(parts)
+
+            try:
+                if isinstance(message, str):
+                    await send_text(message)
+                else:
+                    await send_bytes(message)
             except Exception as e:
-                logger.error(f"Error sending text to {connection_id}: {e}")
+                logger.error("Error sending to %s: %s", connection_id, e)
                 await self.disconnect(connection_id)
+                return
+
+    def _enqueue(self, connection_id: str, message) -> bool:
+        """Queue a message for a connection's writer task, dropping the client if its queue is full"""
+        rec = self.connections.get(connection_id)
+        if rec is None:
+            return False
+        try:
+            rec.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue for %s is full (%s messages), disconnecting slow client", connection_id, OUTBOUND_QUEUE_SIZE)
+            self._drop(connection_id, code=1013)
+            return False
+
+    def _drop(self, connection_id: str, code: int):
+        """Remove a connection without flushing its queue, closing its socket in the background"""
+        rec = self._unregister(connection_id)
+        if rec is None:
+            return
+        if rec.writer is not asyncio.current_task():
+            rec.writer.cancel()
+        task = asyncio.create_task(self._close_quietly(rec.ws, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        logger.info("Total active connections: %s", len(self.connections))
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, code: int):
+        """Close a socket, ignoring errors from connections that are already gone"""
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass  # Connection might already be closed
+
+    async def send_text(self, connection_id: str, message: str):
+        """Send a text message to a specific connection"""
+        self._enqueue(connection_id, message)
 
     async def send_bytes(self, connection_id: str, data: bytes):
         """Send binary data to a specific connection"""
-        if connection_id in self.active_connections:
-            try:
-                await self.active_connections[connection_id].send_bytes(data)
-            except Exception as e:
-                logger.error(f"Error sending bytes to {connection_id}: {e}")
-                await self.disconnect(connection_id)
+        self._enqueue(connection_id, data)
+
+    async def send_audio(self, connection_id: str, data: bytes):
+        """
+        Send a raw PCM audio chunk to a specific connection.
+
+        Unlike send_bytes, consecutive queued chunks may be delivered as one binary
+        frame, so only use this for payloads that clients simply concatenate.
+        """
+        self._enqueue(connection_id, memoryview(data))
 
     async def send_json(self, connection_id: str, data: dict):
         """Send JSON data to a specific connection"""
-        if connection_id in self.active_connections:
-            try:
-                await self.active_connections[connection_id].send_json(data)
-            except Exception as e:
-                logger.error(f"Error sending JSON to {connection_id}: {e}")
-                await self.disconnect(connection_id)
+        # Sent as a text frame, like WebSocket.send_json, but with a faster encoder
+        self._enqueue(connection_id, json_dumps(data))
+
+    def _broadcast(self, message: str):
+        """
+        Queue a message for every connected client.
+
+        Goes through each connection's writer like any other send, so a broadcast never
+        races a writer on the same socket or overtakes messages already queued for it.
+        Clients with a full queue are dropped; broken sockets are cleaned up by their writer.
+        """
+        # Snapshot the ids: dropping a slow client mutates the table
+        for connection_id in tuple(self.connections):
+            self._enqueue(connection_id, message)
 
     async def broadcast_text(self, message: str):
         """Broadcast a text message to all connected clients"""
-        disconnected = []
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting text to {connection_id}: {e}")
-                disconnected.append(connection_id)
-
-        # Clean up disconnected clients
-        for connection_id in disconnected:
-            await self.disconnect(connection_id)
+        self._broadcast(message)
 
     async def broadcast_json(self, data: dict):
         """Broadcast JSON data to all connected clients"""
-        disconnected = []
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                logger.error(f"Error broadcasting JSON to {connection_id}: {e}")
-                disconnected.append(connection_id)
-
-        # Clean up disconnected clients
-        for connection_id in disconnected:
-            await self.disconnect(connection_id)
+        # Serialize once and share the payload, instead of one encode per client in send_json
+        self._broadcast(json_dumps(data))
 
     def get_connection_count(self) -> int:
         """Get the number of active connections"""
-        return len(self.active_connections)
+        return len(self.connections)
 
     def get_connection_state(self, connection_id: str) -> str:
         """Get the state of a specific connection"""
-        return self.connection_states.get(connection_id, "unknown")
+        rec = self.connections.get(connection_id)
+        return rec.state if rec is not None else "unknown"
 
     def update_connection_state(self, connection_id: str, state: str):
         """Update the state of a connection"""
-        if connection_id in self.connection_states:
-            self.connection_states[connection_id] = state
-            logger.debug(f"Connection {connection_id} state updated to: {state}")
+        rec = self.connections.get(connection_id)
+        if rec is not None:
+            rec.state = state
+            logger.debug("Connection %s state updated to: %s", connection_id, state)
 
     def is_connected(self, connection_id: str) -> bool:
         """Check if a connection is active"""
-        return connection_id in self.active_connections
+        return connection_id in self.connections
 
 
 # Global connection manager instance
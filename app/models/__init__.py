@@ -2,7 +2,7 @@
 Pydantic models for request and response validation
 """
 
-from .requests import TTSRequest, TrueStreamingRequest, WebSocketStreamingMessage
+from .requests import TTSRequest, TrueStreamingRequest, WebSocketStreamingMessage, WS_MESSAGE_ADAPTER
 from .responses import (
     HealthResponse,
     ModelInfo,
@@ -41,6 +41,7 @@ __all__ = [
     "TTSRequest",
     "TrueStreamingRequest",
     "WebSocketStreamingMessage",
+    "WS_MESSAGE_ADAPTER",
     "HealthResponse",
     "ModelInfo",
     "ModelsResponse",
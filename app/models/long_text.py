@@ -8,6 +8,8 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
 
+from .requests import CfgWeight, Exaggeration, Temperature
+
 
 class LongTextJobStatus(str, Enum):
     """Status enum for long text jobs"""
@@ -31,9 +33,9 @@ class LongTextRequest(BaseModel):
     input: str = Field(..., min_length=3001, description="Text to convert to speech (must be > 3000 characters)")
     voice: Optional[str] = Field(None, description="Voice name from library or OpenAI voice name")
     response_format: Optional[str] = Field("mp3", description="Audio format (mp3 or wav)")
-    exaggeration: Optional[float] = Field(None, ge=0.25, le=2.0, description="Emotion intensity")
-    cfg_weight: Optional[float] = Field(None, ge=0.0, le=1.0, description="Pace control")
-    temperature: Optional[float] = Field(None, ge=0.05, le=5.0, description="Sampling temperature")
+    exaggeration: Optional[Exaggeration] = Field(None, description="Emotion intensity")
+    cfg_weight: Optional[CfgWeight] = Field(None, description="Pace control")
+    temperature: Optional[Temperature] = Field(None, description="Sampling temperature")
     session_id: Optional[str] = Field(None, description="Frontend session ID for tracking")
 
     @field_validator('input')
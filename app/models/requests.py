@@ -2,59 +2,38 @@
 Request models for API validation
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+# Generation parameter bounds, shared by every request model that accepts them
+Exaggeration = Annotated[float, Field(ge=0.25, le=2.0)]
+CfgWeight = Annotated[float, Field(ge=0.0, le=1.0)]
+Temperature = Annotated[float, Field(ge=0.05, le=5.0)]
 
 
 class TTSRequest(BaseModel):
     """Text-to-speech request model"""
-    
+
+    # Strings are stripped (and length-checked) by pydantic-core, so whitespace-only input fails min_length
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     input: str = Field(..., description="The text to generate audio for", min_length=1, max_length=3000)
     voice: Optional[str] = Field("alloy", description="Voice to use (ignored - uses voice sample)")
     response_format: Optional[str] = Field("wav", description="Audio format (always returns WAV)")
     speed: Optional[float] = Field(1.0, description="Speed of speech (ignored)")
-    stream_format: Optional[str] = Field("audio", description="Streaming format: 'audio' for raw audio stream, 'sse' for Server-Side Events")
+    stream_format: Optional[Literal['audio', 'sse']] = Field("audio", description="Streaming format: 'audio' for raw audio stream, 'sse' for Server-Side Events")
     
     # Custom TTS parameters
-    exaggeration: Optional[float] = Field(None, description="Emotion intensity", ge=0.25, le=2.0)
-    cfg_weight: Optional[float] = Field(None, description="Pace control", ge=0.0, le=1.0)
-    temperature: Optional[float] = Field(None, description="Sampling temperature", ge=0.05, le=5.0)
+    exaggeration: Optional[Exaggeration] = Field(None, description="Emotion intensity")
+    cfg_weight: Optional[CfgWeight] = Field(None, description="Pace control")
+    temperature: Optional[Temperature] = Field(None, description="Sampling temperature")
     
     # Streaming-specific parameters
     streaming_chunk_size: Optional[int] = Field(None, description="Characters per streaming chunk", ge=50, le=500)
-    streaming_strategy: Optional[str] = Field(None, description="Chunking strategy for streaming")
+    streaming_strategy: Optional[Literal['sentence', 'paragraph', 'fixed', 'word']] = Field(None, description="Chunking strategy for streaming")
     streaming_buffer_size: Optional[int] = Field(None, description="Number of chunks to buffer", ge=1, le=10)
-    streaming_quality: Optional[str] = Field(None, description="Speed vs quality trade-off")
-    
-    @validator('input')
-    def validate_input(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Input text cannot be empty')
-        return v.strip()
-    
-    @validator('stream_format')
-    def validate_stream_format(cls, v):
-        if v is not None:
-            allowed_formats = ['audio', 'sse']
-            if v not in allowed_formats:
-                raise ValueError(f'stream_format must be one of: {", ".join(allowed_formats)}')
-        return v
-    
-    @validator('streaming_strategy')
-    def validate_streaming_strategy(cls, v):
-        if v is not None:
-            allowed_strategies = ['sentence', 'paragraph', 'fixed', 'word']
-            if v not in allowed_strategies:
-                raise ValueError(f'streaming_strategy must be one of: {", ".join(allowed_strategies)}')
-        return v
-    
-    @validator('streaming_quality')
-    def validate_streaming_quality(cls, v):
-        if v is not None:
-            allowed_qualities = ['fast', 'balanced', 'high']
-            if v not in allowed_qualities:
-                raise ValueError(f'streaming_quality must be one of: {", ".join(allowed_qualities)}')
-        return v
+    streaming_quality: Optional[Literal['fast', 'balanced', 'high']] = Field(None, description="Speed vs quality trade-off")
 
 
 class TrueStreamingRequest(BaseModel):
@@ -72,14 +51,16 @@ class TrueStreamingRequest(BaseModel):
     - enable_fade_in: Fade is always applied, controlled by fade_in_duration_ms
     """
 
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     # Core TTS parameters
     input: str = Field(..., description="The text to generate audio for", min_length=1, max_length=3000)
     voice: Optional[str] = Field("alloy", description="Voice name or alias from voice library")
 
     # Standard TTS parameters (✅ SUPPORTED)
-    exaggeration: Optional[float] = Field(0.5, description="Emotion intensity (0.25-2.0)", ge=0.25, le=2.0)
-    cfg_weight: Optional[float] = Field(0.5, description="Classifier-free guidance weight (0.0-1.0)", ge=0.0, le=1.0)
-    temperature: Optional[float] = Field(0.8, description="Sampling temperature (0.05-5.0)", ge=0.05, le=5.0)
+    exaggeration: Optional[Exaggeration] = Field(0.5, description="Emotion intensity (0.25-2.0)")
+    cfg_weight: Optional[CfgWeight] = Field(0.5, description="Classifier-free guidance weight (0.0-1.0)")
+    temperature: Optional[Temperature] = Field(0.8, description="Sampling temperature (0.05-5.0)")
 
     # Advanced parameters (⚠️ ACCEPTED BUT IGNORED - for future compatibility)
     top_p: Optional[float] = Field(0.95, description="[IGNORED] Nucleus sampling threshold (not supported by generate_stream)", ge=0.0, le=1.0)
@@ -98,26 +79,13 @@ class TrueStreamingRequest(BaseModel):
     fade_in_duration_ms: Optional[int] = Field(20, description="Fade-in duration in milliseconds (0=disable fade)", ge=0, le=100)
 
     # Output format
-    output_format: Optional[str] = Field("wav", description="Audio format: 'wav' (raw PCM) or 'base64' (base64-encoded)")
+    output_format: Optional[Literal['wav', 'base64']] = Field("wav", description="Audio format: 'wav' (raw PCM) or 'base64' (base64-encoded)")
+    metrics_format: Optional[Literal['json', 'msgpack']] = Field("json", description="Metrics encoding: 'json' (text frames) or 'msgpack' (each audio chunk and its metrics in one length-prefixed binary frame)")
 
     # Metrics and debugging
     include_metrics: Optional[bool] = Field(True, description="Include generation metrics (latency, RTF, token count)")
     print_metrics: Optional[bool] = Field(False, description="Print metrics to server console")
 
-    @validator('input')
-    def validate_input(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Input text cannot be empty')
-        return v.strip()
-
-    @validator('output_format')
-    def validate_output_format(cls, v):
-        if v is not None:
-            allowed_formats = ['wav', 'base64']
-            if v not in allowed_formats:
-                raise ValueError(f'output_format must be one of: {", ".join(allowed_formats)}')
-        return v
-
 
 class WebSocketStreamingMessage(BaseModel):
     """
@@ -126,12 +94,12 @@ class WebSocketStreamingMessage(BaseModel):
     Clients send this JSON message over WebSocket to initiate streaming.
     """
 
-    type: str = Field(..., description="Message type: 'stream_request', 'cancel', 'ping'")
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
+    type: Literal['stream_request', 'cancel', 'ping'] = Field(..., description="Message type: 'stream_request', 'cancel', 'ping'")
     data: Optional[TrueStreamingRequest] = Field(None, description="Streaming request data (required for type='stream_request')")
 
-    @validator('type')
-    def validate_type(cls, v):
-        allowed_types = ['stream_request', 'cancel', 'ping']
-        if v not in allowed_types:
-            raise ValueError(f'type must be one of: {", ".join(allowed_types)}')
-        return v 
\ No newline at end of file
+
+# Built once at import: validates raw inbound WebSocket JSON (str/bytes) in pydantic-core,
+# including the nested TrueStreamingRequest, without a separate json.loads pass
+WS_MESSAGE_ADAPTER: TypeAdapter[WebSocketStreamingMessage] = TypeAdapter(WebSocketStreamingMessage)
@@ -7,6 +7,8 @@ and receive TRUE model-level streaming audio in real-time.
 
 Requirements:
     pip install websockets asyncio
+    pip install orjson  # optional, faster JSON
+    pip install msgpack  # optional, for metrics_format="msgpack"
 
 Usage:
     python websocket_client_python.py
@@ -22,9 +24,41 @@ import asyncio
 import json
 import sys
 import struct
+import time
 from pathlib import Path
 import websockets
 
+# Use orjson when installed; the server expects JSON requests as text frames, hence the decode()
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# The server serializes {"type": ..., ...} compactly with "type" first, so metrics
+# messages can be recognized without parsing them
+_METRICS_PREFIX = '{"type":"metrics"'
+
+# Header of msgpack-mode binary frames: u32 little-endian metrics length
+_FRAME_HEADER = struct.Struct("<I")
+_FRAME_HEADER_SIZE = _FRAME_HEADER.size
+
+# Minimum seconds between in-place progress line updates
+PROGRESS_INTERVAL = 0.1
+
+
+def _write_chunks(path: Path, chunks: list):
+    """Write received audio chunks to a file"""
+    with open(path, "wb") as f:
+        f.writelines(chunks)
+
 
 class ChatterboxStreamingClient:
     """Client for Chatterbox TRUE streaming WebSocket API"""
@@ -43,11 +77,19 @@ class ChatterboxStreamingClient:
     async def connect(self):
         """Connect to the WebSocket server"""
         print(f"Connecting to {self.ws_url}...")
-        self.websocket = await websockets.connect(self.ws_url)
+        # PCM audio does not compress, so skip per-message deflate; allow frames up to 8 MiB
+        # and buffer at most 64 incoming messages
+        self.websocket = await websockets.connect(
+            self.ws_url,
+            compression=None,
+            max_size=2**23,
+            max_queue=64,
+            ping_interval=20
+        )
 
         # Wait for connection confirmation
         message = await self.websocket.recv()
-        data = json.loads(message)
+        data = _loads(message)
 
         if data.get("type") == "connected":
             connection_id = data.get("connection_id")
@@ -73,7 +115,8 @@ class ChatterboxStreamingClient:
         cfg_weight: float = 0.5,
         exaggeration: float = 0.5,
         include_metrics: bool = True,
-        print_metrics: bool = True
+        print_metrics: bool = True,
+        metrics_format: str = "json"
     ):
         """
         Stream speech synthesis for the given text.
@@ -88,11 +131,16 @@ class ChatterboxStreamingClient:
             exaggeration: Emotion intensity (0.25-2.0)
             include_metrics: Include generation metrics in responses
             print_metrics: Print metrics to console during generation
+            metrics_format: "json" (metrics as separate text messages) or "msgpack"
+                (each audio chunk and its metrics in one binary frame; requires msgpack)
         """
 
         if not self.websocket:
             raise RuntimeError("Not connected. Call connect() first.")
 
+        if metrics_format == "msgpack" and msgpack is None:
+            raise RuntimeError("metrics_format='msgpack' requires the msgpack package")
+
         # Prepare streaming request
         request = {
             "type": "stream_request",
@@ -106,6 +154,7 @@ class ChatterboxStreamingClient:
                 "output_format": "wav",
                 "include_metrics": include_metrics,
                 "print_metrics": print_metrics,
+                "metrics_format": metrics_format,
                 "enable_fade_in": True,
                 "fade_in_duration_ms": 20,
                 "context_window": 50,
@@ -122,13 +171,43 @@ class ChatterboxStreamingClient:
         print(f"   Temperature: {temperature}")
         print()
 
-        await self.websocket.send(json.dumps(request))
+        await self.websocket.send(_dumps(request))
 
         # Receive response
-        audio_data = bytearray()
+        # Received audio, kept as separate chunks and written out in one go at the end.
+        # The total size is not known up front (the model decides when speech ends),
+        # so there is nothing to pre-size a single buffer with.
+        chunks: list = []
         chunk_count = 0
         metrics_history = []
 
+        # With msgpack, every binary frame is [u32 metadata length][msgpack metrics][audio]
+        framed = metrics_format == "msgpack"
+
+        # Progress lines are redrawn at most every PROGRESS_INTERVAL, not once per chunk.
+        # The chunk and RTF lines have separate timers: each audio chunk arrives right next
+        # to its metrics, so a shared timer would let one line starve the other.
+        next_chunk_progress = 0.0
+        next_metrics_progress = 0.0
+
+        def handle_metrics(metrics):
+            nonlocal next_metrics_progress
+            metrics_history.append(metrics)
+
+            if include_metrics:
+                chunk_num = metrics.get("chunk", "?")
+                latency = metrics.get("latency_to_first_chunk")
+                rtf = metrics.get("rtf", 0)
+
+                if latency and chunk_num == 1:
+                    print(f"   ⚡ Latency to first chunk: {latency:.3f}s")
+
+                now = time.monotonic()
+                if now >= next_metrics_progress:
+                    sys.stdout.write(f"   📊 Chunk {chunk_num}: RTF={rtf:.3f}\r")
+                    sys.stdout.flush()
+                    next_metrics_progress = now + PROGRESS_INTERVAL
+
         print("🎧 Receiving audio stream...")
 
         try:
@@ -137,37 +216,47 @@ class ChatterboxStreamingClient:
 
                 # Check if it's binary (audio data) or text (JSON message)
                 if isinstance(message, bytes):
+                    if framed:
+                        # Split the frame into its metrics and audio parts (memoryview slices, no copies)
+                        (meta_len,) = _FRAME_HEADER.unpack_from(message)
+                        body = memoryview(message)[_FRAME_HEADER_SIZE:]
+                        if meta_len:
+                            handle_metrics(msgpack.unpackb(body[:meta_len]))
+                        message = body[meta_len:]
+                        if not message:
+                            continue
+
                     # Binary audio data
-                    audio_data.extend(message)
+                    chunks.append(message)
                     chunk_count += 1
 
                     # Show progress indicator
                     if chunk_count == 1:
                         print("   ⚡ First audio chunk received!")
                     else:
-                        print(f"   📦 Chunk #{chunk_count} received ({len(message)} bytes)", end='\r')
+                        now = time.monotonic()
+                        if now >= next_chunk_progress:
+                            sys.stdout.write(f"   📦 Chunk #{chunk_count} received ({len(message)} bytes)\r")
+                            sys.stdout.flush()
+                            next_chunk_progress = now + PROGRESS_INTERVAL
+
+                elif message.startswith(_METRICS_PREFIX):
+                    # Fast path for the most frequent text message: no type dispatch
+                    handle_metrics(_loads(message).get("data", {}))
 
                 else:
                     # Text message (JSON)
-                    data = json.loads(message)
+                    data = _loads(message)
                     msg_type = data.get("type")
 
                     if msg_type == "info":
                         print(f"   ℹ️  {data.get('message')}")
+                        # Server fell back to JSON metrics: binary frames are plain audio again
+                        if data.get("metrics_format") == "json":
+                            framed = False
 
                     elif msg_type == "metrics":
-                        metrics = data.get("data", {})
-                        metrics_history.append(metrics)
-
-                        if include_metrics:
-                            chunk_num = metrics.get("chunk", "?")
-                            latency = metrics.get("latency_to_first_chunk")
-                            rtf = metrics.get("rtf", 0)
-
-                            if latency and chunk_num == 1:
-                                print(f"   ⚡ Latency to first chunk: {latency:.3f}s")
-
-                            print(f"   📊 Chunk {chunk_num}: RTF={rtf:.3f}", end='\r')
+                        handle_metrics(data.get("data", {}))
 
                     elif msg_type == "done":
                         total_chunks = data.get("total_chunks", chunk_count)
@@ -184,11 +273,12 @@ class ChatterboxStreamingClient:
             return False
 
         # Save audio to file
-        if audio_data:
+        if chunks:
             output_path = Path(output_file)
-            output_path.write_bytes(audio_data)
+            # Write off the event loop so a large file does not stall the connection
+            await asyncio.to_thread(_write_chunks, output_path, chunks)
 
-            audio_size_kb = len(audio_data) / 1024
+            audio_size_kb = sum(map(len, chunks)) / 1024
             print(f"\n💾 Audio saved to: {output_file}")
             print(f"   Size: {audio_size_kb:.1f} KB")
             print(f"   Chunks: {chunk_count}")
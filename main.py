@@ -10,6 +10,12 @@ import uvicorn
 from app.main import app
 from app.config import Config
 
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 
 def main():
     """Main entry point"""
@@ -18,13 +24,17 @@ def main():
         print(f"Starting Chatterbox TTS API server...")
         print(f"Server will run on http://{Config.HOST}:{Config.PORT}")
         print(f"API documentation available at http://{Config.HOST}:{Config.PORT}/docs")
+        print(f"Event loop: {EVENT_LOOP}")
         
         uvicorn.run(
             "app.main:app",
             host=Config.HOST,
             port=Config.PORT,
             reload=False,
-            access_log=True
+            access_log=True,
+            loop=EVENT_LOOP,
+            # Streamed PCM does not compress; skip per-message deflate on WebSocket frames
+            ws_per_message_deflate=False
         )
     except Exception as e:
         print(f"Failed to start server: {e}")
@@ -20,7 +20,9 @@ def start_dev():
         "--host", "0.0.0.0",
         "--port", "4123",
         "--reload",
-        "--log-level", "debug"
+        "--log-level", "debug",
+        # Streamed PCM does not compress; skip per-message deflate on WebSocket frames
+        "--ws-per-message-deflate", "false"
     ]
     subprocess.run(cmd)
 
@@ -0,0 +1,3 @@
+"""
+Unit tests that run without a live API server
+"""
@@ -0,0 +1,10 @@
+"""
+Pytest configuration for unit tests
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def check_api_health():
+    """Unit tests exercise modules directly, so they don't need a running API"""
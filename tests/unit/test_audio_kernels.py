@@ -0,0 +1,37 @@
+"""
+Unit tests for the float to int16 PCM conversion kernel
+"""
+
+import numpy as np
+
+from app.core.audio_kernels import float_to_pcm16
+
+
+def test_float_to_pcm16_clamps_and_scales():
+    """Samples outside [-1, 1] are clamped, the rest scaled by 32767 and truncated"""
+    samples = np.array([-2.0, -1.0, 0.0, 0.5, 1.0, 2.0], dtype=np.float32)
+
+    pcm = float_to_pcm16(samples)
+
+    assert pcm.dtype == np.int16
+    assert pcm.tolist() == [-32767, -32767, 0, 16383, 32767, 32767]
+
+
+def test_float_to_pcm16_applies_q15_fade_to_leading_samples():
+    """The Q15 fade scales only the first len(fade) samples"""
+    samples = np.ones(5, dtype=np.float32)
+    fade_q15 = np.array([0, 1 << 14, 1 << 15], dtype=np.int32)
+
+    pcm = float_to_pcm16(samples, fade_q15)
+
+    assert pcm.tolist() == [0, 16383, 32767, 32767, 32767]
+
+
+def test_float_to_pcm16_fade_longer_than_chunk():
+    """A fade longer than the chunk is cut to the chunk length"""
+    samples = np.full(2, -1.0, dtype=np.float32)
+    fade_q15 = np.array([1 << 14, 1 << 14, 1 << 14, 1 << 14], dtype=np.int32)
+
+    pcm = float_to_pcm16(samples, fade_q15)
+
+    assert pcm.tolist() == [-16384, -16384]
@@ -0,0 +1,130 @@
+"""
+Unit tests for the WebSocket connection manager's outbound queues and frame format
+"""
+
+import asyncio
+import struct
+
+import msgpack
+import pytest
+
+from app.core.websocket_manager import (
+    COALESCE_MAX_BYTES,
+    OUTBOUND_QUEUE_SIZE,
+    ConnectionManager,
+    pack_audio_frame,
+)
+
+
+class StubWebSocket:
+    """Records every frame sent and the close code instead of talking to a client"""
+
+    def __init__(self):
+        self.sent = []
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(("text", data))
+
+    async def send_bytes(self, data: bytes):
+        self.sent.append(("bytes", bytes(data)))
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+
+@pytest.fixture
+def manager():
+    return ConnectionManager()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_flushes_queued_messages(manager):
+    """Messages queued before disconnect() are all sent, in order"""
+    ws = StubWebSocket()
+    await manager.connect(ws, "c1")
+
+    await manager.send_json("c1", {"type": "start"})
+    await manager.send_bytes("c1", b"header")
+    await manager.send_text("c1", "done")
+    await manager.disconnect("c1")
+
+    assert ws.sent == [("text", '{"type":"start"}'), ("bytes", b"header"), ("text", "done")]
+    assert not manager.is_connected("c1")
+
+
+@pytest.mark.asyncio
+async def test_audio_coalescing_stops_at_text_and_bytes(manager):
+    """Back-to-back audio chunks merge into one frame, but never across other messages"""
+    ws = StubWebSocket()
+    await manager.connect(ws, "c1")
+
+    # Nothing below yields to the writer, so everything is queued before it sends
+    await manager.send_audio("c1", b"a1")
+    await manager.send_audio("c1", b"a2")
+    await manager.send_text("c1", "metrics")
+    await manager.send_audio("c1", b"a3")
+    await manager.send_bytes("c1", b"raw")
+    await manager.send_audio("c1", b"a4")
+    await manager.send_audio("c1", b"a5")
+    await manager.disconnect("c1")
+
+    assert ws.sent == [
+        ("bytes", b"a1a2"),
+        ("text", "metrics"),
+        ("bytes", b"a3"),
+        ("bytes", b"raw"),
+        ("bytes", b"a4a5"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_audio_coalescing_respects_size_limit(manager):
+    """A chunk that would push a merged frame past COALESCE_MAX_BYTES starts a new frame"""
+    ws = StubWebSocket()
+    await manager.connect(ws, "c1")
+
+    half = COALESCE_MAX_BYTES // 2
+    for _ in range(3):
+        await manager.send_audio("c1", b"x" * half)
+    await manager.disconnect("c1")
+
+    assert [len(data) for _, data in ws.sent] == [2 * half, half]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_client_with_1013(manager):
+    """A client whose outbound queue is full is unregistered and closed with 1013 (try again later)"""
+    ws = StubWebSocket()
+    await manager.connect(ws, "c1")
+
+    # The writer never gets to run, so the queue fills up and the next message overflows it
+    for i in range(OUTBOUND_QUEUE_SIZE + 1):
+        await manager.send_text("c1", str(i))
+
+    assert not manager.is_connected("c1")
+    await asyncio.gather(*manager._closing)
+    assert ws.close_code == 1013
+    assert ws.sent == []
+
+
+def test_pack_audio_frame_round_trip():
+    """Frames are [u32 little-endian metadata length][msgpack metadata][audio]"""
+    audio = b"\x01\x00\xff\x7f" * 8
+    metrics = {"chunk_count": 3, "rtf": 0.25, "latency_to_first_chunk": 0.5}
+
+    frame = pack_audio_frame(audio, metrics)
+
+    (meta_len,) = struct.unpack_from("<I", frame)
+    assert msgpack.unpackb(frame[4:4 + meta_len], raw=False) == metrics
+    assert frame[4 + meta_len:] == audio
+
+
+def test_pack_audio_frame_without_metrics():
+    """Without metrics the metadata length is zero and the audio follows the header"""
+    frame = pack_audio_frame(b"pcm")
+
+    assert frame == struct.pack("<I", 0) + b"pcm"